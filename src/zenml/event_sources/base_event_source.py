@@ -215,12 +215,10 @@ class BaseEventSourceHandler(BasePlugin, ABC):
             event_source=event_source
         )
         try:
-            # Instantiate the configuration from the response
-            config = self.validate_event_source_configuration(
-                event_source.configuration
-            )
             # Call the implementation specific method to process the created
-            # event source
+            # event source. The configuration instance validated above is
+            # reused; re-parsing the serialized form would yield the same
+            # object at the cost of a second validation pass.
             self._process_event_source_request(
                 event_source=event_source_response, config=config
             )
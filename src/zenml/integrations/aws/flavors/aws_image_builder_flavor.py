@@ -134,6 +134,10 @@ class AWSImageBuilderFlavor(BaseImageBuilderFlavor):
         """
         return AWSImageBuilderConfig
 
+    # Cached by the `implementation_class` property, which gets called
+    # repeatedly during stack resolution and validation.
+    _implementation_class: Optional[Type["AWSImageBuilder"]] = None
+
     @property
     def implementation_class(self) -> Type["AWSImageBuilder"]:
         """Implementation class.
@@ -141,6 +145,9 @@ class AWSImageBuilderFlavor(BaseImageBuilderFlavor):
         Returns:
             The implementation class.
         """
-        from zenml.integrations.aws.image_builders import AWSImageBuilder
+        if AWSImageBuilderFlavor._implementation_class is None:
+            from zenml.integrations.aws.image_builders import AWSImageBuilder
+
+            AWSImageBuilderFlavor._implementation_class = AWSImageBuilder
 
-        return AWSImageBuilder
+        return AWSImageBuilderFlavor._implementation_class
@@ -13,7 +13,34 @@
 #  permissions and limitations under the License.
 """Initialization of the OpenAI hooks module."""
 
-from zenml.integrations.openai.hooks.open_ai_failure_hook import (
-    openai_chatgpt_alerter_failure_hook,
-    openai_gpt4_alerter_failure_hook,
-)
+from typing import Any
+
+__all__ = [
+    "openai_chatgpt_alerter_failure_hook",
+    "openai_gpt4_alerter_failure_hook",
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the hooks on first attribute access.
+
+    Importing the hooks eagerly would pull in the `openai` SDK for every
+    process that imports this package, even if no hook is ever used.
+
+    Args:
+        name: The name of the attribute to fetch.
+
+    Raises:
+        AttributeError: If the attribute is not defined by this module.
+
+    Returns:
+        The hook with the given name.
+    """
+    if name in __all__:
+        from zenml.integrations.openai.hooks import open_ai_failure_hook
+
+        hook = getattr(open_ai_failure_hook, name)
+        globals()[name] = hook
+        return hook
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,7 +14,8 @@
 """Base model definitions."""
 
 from datetime import datetime
-from typing import Any, Dict, Generic, Optional, TypeVar
+from functools import lru_cache
+from typing import Any, Dict, Generic, Optional, Type, TypeVar, cast
 from uuid import UUID
 
 from pydantic import ConfigDict, Field
@@ -252,6 +253,60 @@ class BaseResponse(BaseZenModel, Generic[AnyBody, AnyMetadata, AnyResources]):
 
         return self.body
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_metadata_type(cls) -> Type[Any]:
+        """Get the concrete metadata class of the response.
+
+        Given that the `metadata` field annotation doesn't change at runtime,
+        we resolve it once per class and cache the result.
+
+        Returns:
+            The metadata class of the response.
+        """
+        metadata_annotation = cls.model_fields["metadata"].annotation
+        assert metadata_annotation is not None, (
+            "For each response model, an annotated metadata "
+            "field should exist."
+        )
+
+        # metadata is defined as:
+        #   metadata: Optional[....ResponseMetadata] = Field(default=None)
+        # We need to find the actual class inside the Optional annotation.
+        from zenml.utils.typing_utils import get_args
+
+        metadata_type = get_args(metadata_annotation)[0]
+        assert issubclass(metadata_type, BaseResponseMetadata)
+
+        return cast(Type[Any], metadata_type)
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _get_resources_type(cls) -> Type[Any]:
+        """Get the concrete resources class of the response.
+
+        Given that the `resources` field annotation doesn't change at runtime,
+        we resolve it once per class and cache the result.
+
+        Returns:
+            The resources class of the response.
+        """
+        resources_annotation = cls.model_fields["resources"].annotation
+        assert resources_annotation is not None, (
+            "For each response model, an annotated resources "
+            "field should exist."
+        )
+
+        # resources is defined as:
+        #   resources: Optional[....ResponseResources] = Field(default=None)
+        # We need to find the actual class inside the Optional annotation.
+        from zenml.utils.typing_utils import get_args
+
+        resources_type = get_args(resources_annotation)[0]
+        assert issubclass(resources_type, BaseResponseResources)
+
+        return cast(Type[Any], resources_type)
+
     def get_metadata(self) -> "AnyMetadata":
         """Fetch the metadata of the entity.
 
@@ -260,19 +315,7 @@ class BaseResponse(BaseZenModel, Generic[AnyBody, AnyMetadata, AnyResources]):
         """
         if self.metadata is None:
             # If the metadata is not there, check the class first.
-            metadata_annotation = self.model_fields["metadata"].annotation
-            assert metadata_annotation is not None, (
-                "For each response model, an annotated metadata"
-                "field should exist."
-            )
-
-            # metadata is defined as:
-            #   metadata: Optional[....ResponseMetadata] = Field(default=None)
-            # We need to find the actual class inside the Optional annotation.
-            from zenml.utils.typing_utils import get_args
-
-            metadata_type = get_args(metadata_annotation)[0]
-            assert issubclass(metadata_type, BaseResponseMetadata)
+            metadata_type = self._get_metadata_type()
 
             if len(metadata_type.model_fields):
                 # If the metadata class defines any fields, fetch the metadata
@@ -298,19 +341,7 @@ class BaseResponse(BaseZenModel, Generic[AnyBody, AnyMetadata, AnyResources]):
         """
         if self.resources is None:
             # If the resources are not there, check the class first.
-            resources_annotation = self.model_fields["resources"].annotation
-            assert resources_annotation is not None, (
-                "For each response model, an annotated resources"
-                "field should exist."
-            )
-
-            # resources is defined as:
-            #   resources: Optional[....ResponseResources] = Field(default=None)
-            # We need to find the actual class inside the Optional annotation.
-            from zenml.utils.typing_utils import get_args
-
-            resources_type = get_args(resources_annotation)[0]
-            assert issubclass(resources_type, BaseResponseResources)
+            resources_type = self._get_resources_type()
 
             if len(resources_type.model_fields):
                 # If the resources class defines any fields, fetch the resources
@@ -14,16 +14,19 @@
 """Collection of all models concerning actions."""
 
 import copy
+import json
 from typing import (
     TYPE_CHECKING,
+    Annotated,
     Any,
     Dict,
     Optional,
+    Type,
     TypeVar,
 )
 from uuid import UUID
 
-from pydantic import Field
+from pydantic import Field, StringConstraints
 
 from zenml.constants import STR_FIELD_MAX_LENGTH
 from zenml.enums import PluginSubType
@@ -39,32 +42,55 @@ from zenml.models.v2.base.scoped import (
 from zenml.models.v2.core.user import UserResponse
 
 if TYPE_CHECKING:
+    from zenml.client import Client
     from zenml.zen_stores.schemas import BaseSchema
 
     AnySchema = TypeVar("AnySchema", bound=BaseSchema)
 
 
+_client_class: Optional[Type["Client"]] = None
+
+
+def _get_client_class() -> Type["Client"]:
+    """Get the `Client` class without re-importing it on every call.
+
+    The import has to stay out of the module level to avoid a circular
+    import, but hydration runs once per response item in list calls, so the
+    class is cached in a module-level variable after the first import.
+
+    Returns:
+        The `Client` class.
+    """
+    global _client_class
+    if _client_class is None:
+        from zenml.client import Client
+
+        _client_class = Client
+
+    return _client_class
+
+
+# Reusing a single constrained type lets pydantic build one core schema for
+# all short string fields instead of one per field.
+ShortStr = Annotated[str, StringConstraints(max_length=STR_FIELD_MAX_LENGTH)]
+
+
 # ------------------ Request Model ------------------
 
 
 class ActionRequest(WorkspaceScopedRequest):
     """Model for creating a new action."""
 
-    name: str = Field(
-        title="The name of the action.", max_length=STR_FIELD_MAX_LENGTH
-    )
-    description: str = Field(
+    name: ShortStr = Field(title="The name of the action.")
+    description: ShortStr = Field(
         default="",
         title="The description of the action",
-        max_length=STR_FIELD_MAX_LENGTH,
     )
-    flavor: str = Field(
+    flavor: ShortStr = Field(
         title="The flavor of the action.",
-        max_length=STR_FIELD_MAX_LENGTH,
     )
     plugin_subtype: PluginSubType = Field(
         title="The subtype of the action.",
-        max_length=STR_FIELD_MAX_LENGTH,
     )
     configuration: Dict[str, Any] = Field(
         title="The configuration for the action.",
@@ -87,15 +113,13 @@ class ActionRequest(WorkspaceScopedRequest):
 class ActionUpdate(BaseUpdate):
     """Update model for actions."""
 
-    name: Optional[str] = Field(
+    name: Optional[ShortStr] = Field(
         default=None,
         title="The new name for the action.",
-        max_length=STR_FIELD_MAX_LENGTH,
     )
-    description: Optional[str] = Field(
+    description: Optional[ShortStr] = Field(
         default=None,
         title="The new description for the action.",
-        max_length=STR_FIELD_MAX_LENGTH,
     )
     configuration: Optional[Dict[str, Any]] = Field(
         default=None,
@@ -123,9 +147,15 @@ class ActionUpdate(BaseUpdate):
         Returns:
             The update model.
         """
-        return ActionUpdate(
-            configuration=copy.deepcopy(response.configuration),
-        )
+        try:
+            # The configuration is JSON-serializable as it is sent over the
+            # wire, and a JSON round-trip clones plain dicts considerably
+            # faster than `copy.deepcopy`.
+            configuration = json.loads(json.dumps(response.configuration))
+        except (TypeError, ValueError):
+            configuration = copy.deepcopy(response.configuration)
+
+        return ActionUpdate(configuration=configuration)
 
 
 # ------------------ Response Model ------------------
@@ -134,23 +164,20 @@ class ActionUpdate(BaseUpdate):
 class ActionResponseBody(WorkspaceScopedResponseBody):
     """Response body for actions."""
 
-    flavor: str = Field(
+    flavor: ShortStr = Field(
         title="The flavor of the action.",
-        max_length=STR_FIELD_MAX_LENGTH,
     )
     plugin_subtype: PluginSubType = Field(
         title="The subtype of the action.",
-        max_length=STR_FIELD_MAX_LENGTH,
     )
 
 
 class ActionResponseMetadata(WorkspaceScopedResponseMetadata):
     """Response metadata for actions."""
 
-    description: str = Field(
+    description: ShortStr = Field(
         default="",
         title="The description of the action.",
-        max_length=STR_FIELD_MAX_LENGTH,
     )
     configuration: Dict[str, Any] = Field(
         title="The configuration for the action.",
@@ -176,9 +203,8 @@ class ActionResponse(
 ):
     """Response model for actions."""
 
-    name: str = Field(
+    name: ShortStr = Field(
         title="The name of the action.",
-        max_length=STR_FIELD_MAX_LENGTH,
     )
 
     def get_hydrated_version(self) -> "ActionResponse":
@@ -187,9 +213,7 @@ class ActionResponse(
         Returns:
             An instance of the same entity with the metadata field attached.
         """
-        from zenml.client import Client
-
-        return Client().zen_store.get_action(self.id)
+        return _get_client_class()().zen_store.get_action(self.id)
 
     # Body and metadata properties
     @property
@@ -13,7 +13,8 @@
 #  permissions and limitations under the License.
 """Models representing workspaces."""
 
-from typing import Optional
+from typing import ClassVar, List, Optional
+from uuid import UUID
 
 from pydantic import Field
 
@@ -125,7 +126,20 @@ class WorkspaceResponse(
 class WorkspaceFilter(BaseFilter):
     """Model to enable advanced filtering of all Workspaces."""
 
+    FILTER_EXCLUDE_FIELDS: ClassVar[List[str]] = [
+        *BaseFilter.FILTER_EXCLUDE_FIELDS,
+        "after_id",
+    ]
+
     name: Optional[str] = Field(
         default=None,
         description="Name of the workspace",
     )
+    after_id: Optional[UUID] = Field(
+        default=None,
+        description="Pagination cursor: only return workspaces with an ID "
+        "greater than this value, ordered by ID. When set, the database can "
+        "seek directly to the cursor position instead of scanning and "
+        "discarding all preceding pages, and any `sort_by` value is "
+        "overridden to keep the iteration stable.",
+    )
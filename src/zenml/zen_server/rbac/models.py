@@ -13,11 +13,11 @@
 #  permissions and limitations under the License.
 """RBAC model classes."""
 
+import sys
+from dataclasses import dataclass, field
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
-
 from zenml.utils.enum_utils import StrEnum
 
 
@@ -74,22 +74,52 @@ class ResourceType(StrEnum):
     # WORKSPACE = "workspace"
 
 
-class Resource(BaseModel):
+# The enum values are used pervasively as dict keys and set members on the
+# RBAC hot paths. Interning them makes equality checks and hashing fall
+# through to pointer comparison, even against strings that were constructed
+# dynamically (e.g. parsed from an API payload) and interned there as well.
+for _action in Action:
+    _action._value_ = sys.intern(_action._value_)
+for _resource_type in ResourceType:
+    _resource_type._value_ = sys.intern(_resource_type._value_)
+del _action, _resource_type
+
+
+# A plain frozen dataclass instead of a pydantic model: resources are
+# constructed for every permission check, often many times per request, and
+# don't need any field coercion or validation.
+@dataclass(frozen=True)
+class Resource:
     """RBAC resource model."""
 
     type: str
     id: Optional[UUID] = None
 
-    def __str__(self) -> str:
-        """Convert to a string.
+    _string_representation: str = field(default="", compare=False, repr=False)
 
-        Returns:
-            Resource string representation.
+    def __post_init__(self) -> None:
+        """Compute the string representation.
+
+        The dataclass is frozen, so the representation is invariant and can
+        be computed once instead of on every `__str__` call.
         """
-        representation = self.type
+        if type(self.type) is str:
+            # Resource types parsed off the wire arrive as plain strings;
+            # intern them so comparisons against the (interned) enum values
+            # short-circuit on identity.
+            object.__setattr__(self, "type", sys.intern(self.type))
+
+        representation = str(self.type)
         if self.id:
             representation += f"/{self.id}"
 
-        return representation
+        # `object.__setattr__` is required because the dataclass is frozen.
+        object.__setattr__(self, "_string_representation", representation)
+
+    def __str__(self) -> str:
+        """Convert to a string.
 
-    model_config = ConfigDict(frozen=True)
+        Returns:
+            Resource string representation.
+        """
+        return self._string_representation
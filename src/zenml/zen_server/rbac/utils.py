@@ -13,6 +13,10 @@
 #  permissions and limitations under the License.
 """RBAC utility functions."""
 
+import asyncio
+import time
+from functools import lru_cache
+from threading import Lock
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -21,6 +25,7 @@ from typing import (
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     TypeVar,
 )
@@ -296,6 +301,25 @@ def verify_permission(
     batch_verify_permissions(resources={resource}, action=action)
 
 
+# Short-lived per-worker cache for allowed resource ID lookups. Sibling
+# endpoints frequently resolve the same (user, resource type, action) tuple
+# many times in quick succession, and each lookup is a round-trip to the RBAC
+# backend. The TTL is deliberately tiny to keep the staleness window after a
+# permission change negligible.
+_ALLOWED_IDS_CACHE_TTL = 0.1  # seconds
+_ALLOWED_IDS_CACHE_MAX_SIZE = 4096
+_allowed_ids_cache: Dict[
+    Tuple[str, str, str], Tuple[float, Optional[Set[UUID]]]
+] = {}
+_allowed_ids_cache_lock = Lock()
+
+
+def _invalidate_allowed_resource_ids_cache() -> None:
+    """Invalidate all cached allowed resource ID lookups."""
+    with _allowed_ids_cache_lock:
+        _allowed_ids_cache.clear()
+
+
 def get_allowed_resource_ids(
     resource_type: str,
     action: Action = Action.READ,
@@ -316,6 +340,14 @@ def get_allowed_resource_ids(
     auth_context = get_auth_context()
     assert auth_context
 
+    cache_key = (str(auth_context.user.id), str(resource_type), str(action))
+    now = time.monotonic()
+
+    with _allowed_ids_cache_lock:
+        cache_entry = _allowed_ids_cache.get(cache_key)
+        if cache_entry and now - cache_entry[0] < _ALLOWED_IDS_CACHE_TTL:
+            return cache_entry[1]
+
     (
         has_full_resource_access,
         allowed_ids,
@@ -325,10 +357,48 @@ def get_allowed_resource_ids(
         action=action,
     )
 
-    if has_full_resource_access:
-        return None
+    result: Optional[Set[UUID]] = None
+    if not has_full_resource_access:
+        result = {UUID(id) for id in allowed_ids}
+
+    with _allowed_ids_cache_lock:
+        if len(_allowed_ids_cache) >= _ALLOWED_IDS_CACHE_MAX_SIZE:
+            _allowed_ids_cache.clear()
+        _allowed_ids_cache[cache_key] = (now, result)
 
-    return {UUID(id) for id in allowed_ids}
+    return result
+
+
+async def get_allowed_resource_ids_batch(
+    resource_types: Sequence[str],
+    action: Action = Action.READ,
+) -> Dict[str, Optional[Set[UUID]]]:
+    """Get the allowed resource IDs for multiple resource types.
+
+    The RBAC backend does not expose a batch query, so the per-type lookups
+    are issued concurrently in worker threads instead of sequentially.
+
+    Args:
+        resource_types: The resource types.
+        action: The action the user wants to perform on the resources.
+
+    Returns:
+        A dictionary mapping each resource type to its allowed resource IDs,
+        or to `None` if the user has full access to all instances of that
+        resource type.
+    """
+    results = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                get_allowed_resource_ids,
+                resource_type=resource_type,
+                action=action,
+            )
+            for resource_type in resource_types
+        )
+    )
+
+    return dict(zip(resource_types, results))
 
 
 def get_resource_for_model(model: AnyResponse) -> Optional[Resource]:
@@ -378,17 +448,14 @@ def get_surrogate_permission_model_for_model(
     return model
 
 
-def get_resource_type_for_model(
-    model: AnyResponse,
-) -> Optional[ResourceType]:
-    """Get the resource type associated with a model object.
+@lru_cache(maxsize=1)
+def _get_resource_type_mapping() -> Dict[Any, ResourceType]:
+    """Get the mapping from model classes to resource types.
 
-    Args:
-        model: The model for which to get the resource type.
+    Given that this mapping doesn't change at runtime, we cache it.
 
     Returns:
-        The resource type associated with the model, or `None` if the model
-        is not associated with any resource type.
+        The mapping from model classes to resource types.
     """
     from zenml.models import (
         ActionResponse,
@@ -415,10 +482,7 @@ def get_resource_type_for_model(
         TriggerResponse,
     )
 
-    mapping: Dict[
-        Any,
-        ResourceType,
-    ] = {
+    return {
         ActionResponse: ResourceType.ACTION,
         EventSourceResponse: ResourceType.EVENT_SOURCE,
         FlavorResponse: ResourceType.FLAVOR,
@@ -445,7 +509,20 @@ def get_resource_type_for_model(
         ServiceResponse: ResourceType.SERVICE,
     }
 
-    return mapping.get(type(model))
+
+def get_resource_type_for_model(
+    model: AnyResponse,
+) -> Optional[ResourceType]:
+    """Get the resource type associated with a model object.
+
+    Args:
+        model: The model for which to get the resource type.
+
+    Returns:
+        The resource type associated with the model, or `None` if the model
+        is not associated with any resource type.
+    """
+    return _get_resource_type_mapping().get(type(model))
 
 
 def is_owned_by_authenticated_user(model: AnyResponse) -> bool:
@@ -533,16 +610,16 @@ def _get_subresources_for_value(value: Any) -> Set[Resource]:
         return set()
 
 
-def get_schema_for_resource_type(
-    resource_type: ResourceType,
-) -> Type["BaseSchema"]:
-    """Get the database schema for a resource type.
+@lru_cache(maxsize=1)
+def _get_resource_type_schema_mapping() -> Dict[
+    ResourceType, Type["BaseSchema"]
+]:
+    """Get the mapping from resource types to database schemas.
 
-    Args:
-        resource_type: The resource type for which to get the database schema.
+    Given that this mapping doesn't change at runtime, we cache it.
 
     Returns:
-        The database schema.
+        The mapping from resource types to database schemas.
     """
     from zenml.zen_stores.schemas import (
         ActionSchema,
@@ -570,7 +647,7 @@ def get_schema_for_resource_type(
         UserSchema,
     )
 
-    mapping: Dict[ResourceType, Type["BaseSchema"]] = {
+    return {
         ResourceType.STACK: StackSchema,
         ResourceType.FLAVOR: FlavorSchema,
         ResourceType.STACK_COMPONENT: StackComponentSchema,
@@ -598,7 +675,19 @@ def get_schema_for_resource_type(
         ResourceType.TRIGGER_EXECUTION: TriggerExecutionSchema,
     }
 
-    return mapping[resource_type]
+
+def get_schema_for_resource_type(
+    resource_type: ResourceType,
+) -> Type["BaseSchema"]:
+    """Get the database schema for a resource type.
+
+    Args:
+        resource_type: The resource type for which to get the database schema.
+
+    Returns:
+        The database schema.
+    """
+    return _get_resource_type_schema_mapping()[resource_type]
 
 
 def update_resource_membership(
@@ -618,3 +707,4 @@ def update_resource_membership(
     rbac().update_resource_membership(
         user=user, resource=resource, actions=actions
     )
+    _invalidate_allowed_resource_ids_cache()
@@ -14,6 +14,7 @@
 """Cloud RBAC implementation."""
 
 from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+from uuid import UUID
 
 from zenml.zen_server.cloud_utils import cloud_connection
 from zenml.zen_server.rbac.models import Action, Resource
@@ -69,7 +70,7 @@ def _convert_from_cloud_resource(cloud_resource: str) -> Resource:
 
     if "/" in resource_type_and_id:
         resource_type, resource_id = resource_type_and_id.split("/")
-        return Resource(type=resource_type, id=resource_id)
+        return Resource(type=resource_type, id=UUID(resource_id))
     else:
         return Resource(type=resource_type_and_id)
 
@@ -766,13 +766,14 @@ if server_config().rbac_enabled:
             )
 
         verify_permission_for_model(model=model, action=Action.SHARE)
-        for action in actions:
+        resource_actions = [Action(action) for action in actions]
+        for resource_action in resource_actions:
             # Make sure users aren't able to share permissions they don't have
             # themselves
-            verify_permission_for_model(model=model, action=Action(action))
+            verify_permission_for_model(model=model, action=resource_action)
 
         update_resource_membership(
             user=user,
             resource=resource,
-            actions=[Action(action) for action in actions],
+            actions=resource_actions,
         )
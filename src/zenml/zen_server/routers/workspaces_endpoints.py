@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for workspaces."""
 
+import asyncio
 from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
@@ -105,6 +106,7 @@ from zenml.zen_server.rbac.utils import (
     dehydrate_page,
     dehydrate_response_model,
     get_allowed_resource_ids,
+    get_allowed_resource_ids_batch,
     verify_permission,
     verify_permission_for_model,
 )
@@ -121,10 +123,12 @@ router = APIRouter(
     responses={401: error_response},
 )
 
+# Paths are concatenated once at import instead of in every decorator.
+WORKSPACE_DETAIL = WORKSPACES + "/{workspace_name_or_id}"
+
 
 @router.get(
     WORKSPACES,
-    response_model=Page[WorkspaceResponse],
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -176,8 +180,7 @@ def create_workspace(
 
 
 @router.get(
-    WORKSPACES + "/{workspace_name_or_id}",
-    response_model=WorkspaceResponse,
+    WORKSPACE_DETAIL,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -205,7 +208,7 @@ def get_workspace(
 
 
 @router.put(
-    WORKSPACES + "/{workspace_name_or_id}",
+    WORKSPACE_DETAIL,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -225,15 +228,14 @@ def update_workspace(
     Returns:
         The updated workspace.
     """
-    workspace = zen_store().get_workspace(workspace_name_or_id, hydrate=False)
     updated_workspace = zen_store().update_workspace(
-        workspace_id=workspace.id, workspace_update=workspace_update
+        workspace_id=workspace_name_or_id, workspace_update=workspace_update
     )
     return dehydrate_response_model(updated_workspace)
 
 
 @router.delete(
-    WORKSPACES + "/{workspace_name_or_id}",
+    WORKSPACE_DETAIL,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -250,8 +252,7 @@ def delete_workspace(
 
 
 @router.get(
-    WORKSPACES + "/{workspace_name_or_id}" + STACKS,
-    response_model=Page[StackResponse],
+    WORKSPACE_DETAIL + STACKS,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -287,8 +288,7 @@ def list_workspace_stacks(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + STACKS,
-    response_model=StackResponse,
+    WORKSPACE_DETAIL + STACKS,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -355,8 +355,7 @@ def create_stack(
 
 
 @router.get(
-    WORKSPACES + "/{workspace_name_or_id}" + STACK_COMPONENTS,
-    response_model=Page[ComponentResponse],
+    WORKSPACE_DETAIL + STACK_COMPONENTS,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -394,8 +393,7 @@ def list_workspace_stack_components(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + STACK_COMPONENTS,
-    response_model=ComponentResponse,
+    WORKSPACE_DETAIL + STACK_COMPONENTS,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -451,8 +449,7 @@ def create_stack_component(
 
 
 @router.get(
-    WORKSPACES + "/{workspace_name_or_id}" + PIPELINES,
-    response_model=Page[PipelineResponse],
+    WORKSPACE_DETAIL + PIPELINES,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -490,8 +487,7 @@ def list_workspace_pipelines(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + PIPELINES,
-    response_model=PipelineResponse,
+    WORKSPACE_DETAIL + PIPELINES,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -548,8 +544,7 @@ def create_pipeline(
 
 
 @router.get(
-    WORKSPACES + "/{workspace_name_or_id}" + PIPELINE_BUILDS,
-    response_model=Page[PipelineBuildResponse],
+    WORKSPACE_DETAIL + PIPELINE_BUILDS,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -587,8 +582,7 @@ def list_workspace_builds(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + PIPELINE_BUILDS,
-    response_model=PipelineBuildResponse,
+    WORKSPACE_DETAIL + PIPELINE_BUILDS,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -628,8 +622,7 @@ def create_build(
 
 
 @router.get(
-    WORKSPACES + "/{workspace_name_or_id}" + PIPELINE_DEPLOYMENTS,
-    response_model=Page[PipelineDeploymentResponse],
+    WORKSPACE_DETAIL + PIPELINE_DEPLOYMENTS,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -667,8 +660,7 @@ def list_workspace_deployments(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + PIPELINE_DEPLOYMENTS,
-    response_model=PipelineDeploymentResponse,
+    WORKSPACE_DETAIL + PIPELINE_DEPLOYMENTS,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -708,7 +700,7 @@ def create_deployment(
 
 
 @router.get(
-    WORKSPACES + "/{workspace_name_or_id}" + RUN_TEMPLATES,
+    WORKSPACE_DETAIL + RUN_TEMPLATES,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -744,7 +736,7 @@ def list_workspace_run_templates(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + RUN_TEMPLATES,
+    WORKSPACE_DETAIL + RUN_TEMPLATES,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -783,8 +775,7 @@ def create_run_template(
 
 
 @router.get(
-    WORKSPACES + "/{workspace_name_or_id}" + RUNS,
-    response_model=Page[PipelineRunResponse],
+    WORKSPACE_DETAIL + RUNS,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -820,8 +811,7 @@ def list_runs(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + SCHEDULES,
-    response_model=ScheduleResponse,
+    WORKSPACE_DETAIL + SCHEDULES,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -861,8 +851,7 @@ def create_schedule(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + RUNS,
-    response_model=PipelineRunResponse,
+    WORKSPACE_DETAIL + RUNS,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -901,8 +890,7 @@ def create_pipeline_run(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + RUNS + GET_OR_CREATE,
-    response_model=Tuple[PipelineRunResponse, bool],
+    WORKSPACE_DETAIL + RUNS + GET_OR_CREATE,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -960,7 +948,7 @@ def get_or_create_pipeline_run(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + RUN_METADATA,
+    WORKSPACE_DETAIL + RUN_METADATA,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -1028,8 +1016,7 @@ def create_run_metadata(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + SECRETS,
-    response_model=SecretResponse,
+    WORKSPACE_DETAIL + SECRETS,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -1068,8 +1055,7 @@ def create_secret(
 
 
 @router.get(
-    WORKSPACES + "/{workspace_name_or_id}" + CODE_REPOSITORIES,
-    response_model=Page[CodeRepositoryResponse],
+    WORKSPACE_DETAIL + CODE_REPOSITORIES,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -1107,8 +1093,7 @@ def list_workspace_code_repositories(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + CODE_REPOSITORIES,
-    response_model=CodeRepositoryResponse,
+    WORKSPACE_DETAIL + CODE_REPOSITORIES,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -1148,12 +1133,11 @@ def create_code_repository(
 
 
 @router.get(
-    WORKSPACES + "/{workspace_name_or_id}" + STATISTICS,
-    response_model=Dict[str, int],
+    WORKSPACE_DETAIL + STATISTICS,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
-def get_workspace_statistics(
+async def get_workspace_statistics(
     workspace_name_or_id: Union[str, UUID],
     auth_context: AuthContext = Security(authorize),
 ) -> Dict[str, int]:
@@ -1168,48 +1152,58 @@ def get_workspace_statistics(
     Returns:
         All pipelines within the workspace.
     """
-    workspace = zen_store().get_workspace(workspace_name_or_id)
+    workspace = await asyncio.to_thread(
+        zen_store().get_workspace, workspace_name_or_id
+    )
 
     user_id = auth_context.user.id
+
+    # The RBAC lookups and count queries are all independent, blocking
+    # round-trips to the RBAC backend/database. Batching each group of
+    # independent calls reduces the endpoint latency to roughly the slowest
+    # call instead of the sum of all of them.
+    allowed_ids = await get_allowed_resource_ids_batch(
+        resource_types=[
+            ResourceType.STACK_COMPONENT,
+            ResourceType.STACK,
+            ResourceType.PIPELINE_RUN,
+            ResourceType.PIPELINE,
+        ],
+    )
+
     component_filter = ComponentFilter(workspace_id=workspace.id)
     component_filter.configure_rbac(
         authenticated_user_id=user_id,
-        id=get_allowed_resource_ids(
-            resource_type=ResourceType.STACK_COMPONENT
-        ),
+        id=allowed_ids[ResourceType.STACK_COMPONENT],
     )
 
     stack_filter = StackFilter(workspace_id=workspace.id)
     stack_filter.configure_rbac(
-        authenticated_user_id=user_id,
-        id=get_allowed_resource_ids(resource_type=ResourceType.STACK),
+        authenticated_user_id=user_id, id=allowed_ids[ResourceType.STACK]
     )
 
     run_filter = PipelineRunFilter(workspace_id=workspace.id)
     run_filter.configure_rbac(
         authenticated_user_id=user_id,
-        id=get_allowed_resource_ids(resource_type=ResourceType.PIPELINE_RUN),
+        id=allowed_ids[ResourceType.PIPELINE_RUN],
     )
 
     pipeline_filter = PipelineFilter(workspace_id=workspace.id)
     pipeline_filter.configure_rbac(
-        authenticated_user_id=user_id,
-        id=get_allowed_resource_ids(resource_type=ResourceType.PIPELINE),
+        authenticated_user_id=user_id, id=allowed_ids[ResourceType.PIPELINE]
     )
 
-    return {
-        "stacks": zen_store().count_stacks(filter_model=stack_filter),
-        "components": zen_store().count_stack_components(
-            filter_model=component_filter
-        ),
-        "pipelines": zen_store().count_pipelines(filter_model=pipeline_filter),
-        "runs": zen_store().count_runs(filter_model=run_filter),
-    }
+    return await asyncio.to_thread(
+        zen_store().count_workspace_statistics,
+        stack_filter=stack_filter,
+        component_filter=component_filter,
+        pipeline_filter=pipeline_filter,
+        run_filter=run_filter,
+    )
 
 
 @router.get(
-    WORKSPACES + "/{workspace_name_or_id}" + SERVICE_CONNECTORS,
-    response_model=Page[ServiceConnectorResponse],
+    WORKSPACE_DETAIL + SERVICE_CONNECTORS,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -1247,8 +1241,7 @@ def list_workspace_service_connectors(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + SERVICE_CONNECTORS,
-    response_model=ServiceConnectorResponse,
+    WORKSPACE_DETAIL + SERVICE_CONNECTORS,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -1288,11 +1281,7 @@ def create_service_connector(
 
 
 @router.get(
-    WORKSPACES
-    + "/{workspace_name_or_id}"
-    + SERVICE_CONNECTORS
-    + SERVICE_CONNECTOR_RESOURCES,
-    response_model=List[ServiceConnectorResourcesModel],
+    WORKSPACE_DETAIL + SERVICE_CONNECTORS + SERVICE_CONNECTOR_RESOURCES,
     responses={401: error_response, 404: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -1341,8 +1330,7 @@ def list_service_connector_resources(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + MODELS,
-    response_model=ModelResponse,
+    WORKSPACE_DETAIL + MODELS,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -1382,12 +1370,7 @@ def create_model(
 
 
 @router.post(
-    WORKSPACES
-    + "/{workspace_name_or_id}"
-    + MODELS
-    + "/{model_name_or_id}"
-    + MODEL_VERSIONS,
-    response_model=ModelVersionResponse,
+    WORKSPACE_DETAIL + MODELS + "/{model_name_or_id}" + MODEL_VERSIONS,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -1429,8 +1412,7 @@ def create_model_version(
 
 
 @router.post(
-    WORKSPACES + "/{workspace_name_or_id}" + SERVICES,
-    response_model=ServiceResponse,
+    WORKSPACE_DETAIL + SERVICES,
     responses={401: error_response, 409: error_response, 422: error_response},
 )
 @handle_exceptions
@@ -202,6 +202,35 @@ def initialize_plugins() -> None:
     plugin_flavor_registry().initialize_plugins()
 
 
+def initialize_model_schemas() -> None:
+    """Eagerly build the pydantic cores of all API models.
+
+    Pydantic builds validators, serializers and JSON schemas lazily on first
+    use, which makes the first request that touches each model pay a
+    schema-build penalty. Building them at startup instead shifts that cost
+    to container startup, where it is amortized over the container lifetime.
+    """
+    from pydantic import BaseModel
+
+    import zenml.models
+
+    for attribute in vars(zenml.models).values():
+        if not isinstance(attribute, type) or not issubclass(
+            attribute, BaseModel
+        ):
+            continue
+        try:
+            attribute.model_rebuild()
+            attribute.model_json_schema()
+        except Exception as e:
+            # A model that can't be materialized here will fail the same way
+            # on first use; don't prevent the server from starting.
+            logger.debug(
+                f"Failed to pre-build schema for model "
+                f"`{attribute.__name__}`: {e}"
+            )
+
+
 def initialize_zen_store() -> None:
     """Initialize the ZenML Store.
 
@@ -359,13 +388,9 @@ def handle_exceptions(func: F) -> F:
         Decorated function.
     """
 
-    @wraps(func)
-    def decorated(*args: Any, **kwargs: Any) -> Any:
-        # These imports can't happen at module level as this module is also
+    def _set_auth_context(*args: Any, **kwargs: Any) -> None:
+        # This import can't happen at module level as this module is also
         # used by the CLI when installed without the `server` extra
-        from fastapi import HTTPException
-        from fastapi.responses import JSONResponse
-
         from zenml.zen_server.auth import AuthContext, set_auth_context
 
         for arg in args:
@@ -378,20 +403,44 @@ def handle_exceptions(func: F) -> F:
                     set_auth_context(arg)
                     break
 
-        try:
-            return func(*args, **kwargs)
-        except OAuthError as error:
+    def _handle_exception(error: Exception) -> Any:
+        # These imports can't happen at module level as this module is also
+        # used by the CLI when installed without the `server` extra
+        from fastapi import HTTPException
+        from fastapi.responses import JSONResponse
+
+        if isinstance(error, OAuthError):
             # The OAuthError is special because it needs to have a JSON response
             return JSONResponse(
                 status_code=error.status_code,
                 content=error.to_dict(),
             )
-        except HTTPException:
-            raise
+        if isinstance(error, HTTPException):
+            raise error
+        logger.exception("API error")
+        raise http_exception_from_error(error)
+
+    if inspect.iscoroutinefunction(func):
+
+        @wraps(func)
+        async def async_decorated(*args: Any, **kwargs: Any) -> Any:
+            _set_auth_context(*args, **kwargs)
+
+            try:
+                return await func(*args, **kwargs)
+            except Exception as error:
+                return _handle_exception(error)
+
+        return cast(F, async_decorated)
+
+    @wraps(func)
+    def decorated(*args: Any, **kwargs: Any) -> Any:
+        _set_auth_context(*args, **kwargs)
+
+        try:
+            return func(*args, **kwargs)
         except Exception as error:
-            logger.exception("API error")
-            http_exception = http_exception_from_error(error)
-            raise http_exception
+            return _handle_exception(error)
 
     return cast(F, decorated)
 
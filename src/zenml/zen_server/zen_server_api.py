@@ -98,6 +98,7 @@ from zenml.zen_server.secure_headers import (
 from zenml.zen_server.utils import (
     initialize_feature_gate,
     initialize_memcache,
+    initialize_model_schemas,
     initialize_plugins,
     initialize_rbac,
     initialize_workload_manager,
@@ -389,6 +390,7 @@ def initialize() -> None:
     initialize_feature_gate()
     initialize_workload_manager()
     initialize_plugins()
+    initialize_model_schemas()
     initialize_secure_headers()
     initialize_memcache(cfg.memcache_max_capacity, cfg.memcache_default_expiry)
     if cfg.deployment_type == ServerDeploymentType.CLOUD:
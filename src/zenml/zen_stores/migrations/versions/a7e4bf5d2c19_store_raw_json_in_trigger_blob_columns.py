@@ -0,0 +1,66 @@
+"""store raw json in trigger blob columns [a7e4bf5d2c19].
+
+Revision ID: a7e4bf5d2c19
+Revises: 0.75.0
+Create Date: 2025-02-20 10:12:41.513274
+
+"""
+
+import base64
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a7e4bf5d2c19"
+down_revision = "0.75.0"
+branch_labels = None
+depends_on = None
+
+
+def _transcode_column(table_name: str, column_name: str, encode: bool) -> None:
+    """Base64-decode or -encode all values of a binary column in place.
+
+    Args:
+        table_name: The name of the table to migrate.
+        column_name: The name of the binary column to migrate.
+        encode: If `True`, base64-encode the values, otherwise decode them.
+    """
+    conn = op.get_bind()
+    meta = sa.MetaData()
+    meta.reflect(only=(table_name,), bind=conn)
+    table = sa.Table(table_name, meta)
+    column = table.c[column_name]
+
+    rows = conn.execute(sa.select(table.c.id, column)).fetchall()
+
+    for row_id, value in rows:
+        if value is None:
+            continue
+
+        new_value = (
+            base64.b64encode(value) if encode else base64.b64decode(value)
+        )
+        conn.execute(
+            sa.update(table)
+            .where(table.c.id == row_id)
+            .values({column_name: new_value})
+        )
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    # The trigger blob columns used to store base64-wrapped JSON, which
+    # inflates the stored bytes by a third and adds an extra encode/decode
+    # pass on every read and write for no benefit over the binary-safe
+    # columns. Unwrap the base64 layer and store the raw JSON bytes.
+    _transcode_column("trigger", "event_filter", encode=False)
+    _transcode_column("trigger", "schedule", encode=False)
+    _transcode_column("trigger_execution", "event_metadata", encode=False)
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    _transcode_column("trigger", "event_filter", encode=True)
+    _transcode_column("trigger", "schedule", encode=True)
+    _transcode_column("trigger_execution", "event_metadata", encode=True)
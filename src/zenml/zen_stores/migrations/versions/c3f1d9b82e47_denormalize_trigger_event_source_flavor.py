@@ -0,0 +1,61 @@
+"""denormalize trigger event source flavor [c3f1d9b82e47].
+
+Revision ID: c3f1d9b82e47
+Revises: a7e4bf5d2c19
+Create Date: 2025-02-21 09:37:18.204561
+
+"""
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c3f1d9b82e47"
+down_revision = "a7e4bf5d2c19"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("trigger", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "event_source_flavor",
+                sqlmodel.sql.sqltypes.AutoString(),
+                nullable=True,
+            )
+        )
+        batch_op.add_column(
+            sa.Column(
+                "event_source_subtype",
+                sqlmodel.sql.sqltypes.AutoString(),
+                nullable=True,
+            )
+        )
+
+    # Backfill the denormalized columns from the event source rows.
+    conn = op.get_bind()
+    meta = sa.MetaData()
+    meta.reflect(only=("trigger", "event_source"), bind=conn)
+    trigger_table = sa.Table("trigger", meta)
+    event_source_table = sa.Table("event_source", meta)
+
+    conn.execute(
+        sa.update(trigger_table).values(
+            event_source_flavor=sa.select(event_source_table.c.flavor)
+            .where(event_source_table.c.id == trigger_table.c.event_source_id)
+            .scalar_subquery(),
+            event_source_subtype=sa.select(event_source_table.c.plugin_subtype)
+            .where(event_source_table.c.id == trigger_table.c.event_source_id)
+            .scalar_subquery(),
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("trigger", schema=None) as batch_op:
+        batch_op.drop_column("event_source_subtype")
+        batch_op.drop_column("event_source_flavor")
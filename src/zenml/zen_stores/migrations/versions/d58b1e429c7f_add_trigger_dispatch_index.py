@@ -0,0 +1,33 @@
+"""add trigger dispatch index [d58b1e429c7f].
+
+Revision ID: d58b1e429c7f
+Revises: c3f1d9b82e47
+Create Date: 2025-02-21 14:05:52.837410
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "d58b1e429c7f"
+down_revision = "c3f1d9b82e47"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("trigger", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_trigger_workspace_id_is_active_event_source_id",
+            ["workspace_id", "is_active", "event_source_id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("trigger", schema=None) as batch_op:
+        batch_op.drop_index(
+            "ix_trigger_workspace_id_is_active_event_source_id"
+        )
@@ -22,6 +22,7 @@ from pydantic.json import pydantic_encoder
 from sqlalchemy import TEXT, Column
 from sqlmodel import Field, Relationship
 
+from zenml.enums import PluginSubType
 from zenml.models import (
     ActionRequest,
     ActionResponse,
@@ -127,15 +128,18 @@ class ActionSchema(NamedSchema, table=True):
         Returns:
             The updated ActionSchema.
         """
-        for field, value in action_update.dict(
-            exclude_unset=True,
-            exclude_none=True,
-        ).items():
+        # Walk the explicitly set fields instead of dumping the full update
+        # model: the pydantic v1 style `.dict()` walks and converts the whole
+        # nested payload in Python only for the configuration to be
+        # re-serialized from the model attribute anyway.
+        for field in action_update.model_fields_set:
+            value = getattr(action_update, field)
+            if value is None:
+                continue
+
             if field == "configuration":
                 self.configuration = base64.b64encode(
-                    json.dumps(
-                        action_update.configuration, default=pydantic_encoder
-                    ).encode("utf-8")
+                    json.dumps(value, default=pydantic_encoder).encode("utf-8")
                 )
             else:
                 setattr(self, field, value)
@@ -161,29 +165,33 @@ class ActionSchema(NamedSchema, table=True):
         Returns:
             The converted model.
         """
-        body = ActionResponseBody(
+        # The values come straight from the database and were validated when
+        # the row was written, so `model_construct` is used to skip the
+        # redundant outbound validation. Any coercion pydantic would
+        # otherwise perform has to happen explicitly here.
+        body = ActionResponseBody.model_construct(
             user=self.user.to_model() if self.user else None,
             created=self.created,
             updated=self.updated,
             flavor=self.flavor,
-            plugin_subtype=self.plugin_subtype,
+            plugin_subtype=PluginSubType(self.plugin_subtype),
         )
         metadata = None
         if include_metadata:
-            metadata = ActionResponseMetadata(
+            metadata = ActionResponseMetadata.model_construct(
                 workspace=self.workspace.to_model(),
-                configuration=json.loads(
-                    base64.b64decode(self.configuration).decode()
-                ),
-                description=self.description,
+                # `json.loads` accepts bytes directly; skip the
+                # intermediate str decode pass.
+                configuration=json.loads(base64.b64decode(self.configuration)),
+                description=self.description or "",
                 auth_window=self.auth_window,
             )
         resources = None
         if include_resources:
-            resources = ActionResponseResources(
+            resources = ActionResponseResources.model_construct(
                 service_account=self.service_account.to_model(),
             )
-        return ActionResponse(
+        return ActionResponse.model_construct(
             id=self.id,
             name=self.name,
             body=body,
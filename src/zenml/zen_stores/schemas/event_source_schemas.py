@@ -152,9 +152,9 @@ class EventSourceSchema(NamedSchema, table=True):
             metadata = EventSourceResponseMetadata(
                 workspace=self.workspace.to_model(),
                 description=self.description,
-                configuration=json.loads(
-                    base64.b64decode(self.configuration).decode()
-                ),
+                # `json.loads` accepts bytes directly; skip the
+                # intermediate str decode pass.
+                configuration=json.loads(base64.b64decode(self.configuration)),
             )
         return EventSourceResponse(
             id=self.id,
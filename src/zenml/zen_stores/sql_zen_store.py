@@ -62,7 +62,7 @@ from sqlalchemy.exc import (
     IntegrityError,
     NoResultFound,
 )
-from sqlalchemy.orm import Mapped, noload
+from sqlalchemy.orm import Mapped, defer, noload, raiseload, selectinload
 from sqlalchemy.util import immutabledict
 
 # Important to note: The select function of SQLModel works slightly differently
@@ -8680,15 +8680,13 @@ class SqlZenStore(BaseZenStore):
             # Verify that the given action exists
             self._get_action(action_id=trigger.action_id, session=session)
 
+            event_source = None
             if trigger.event_source_id:
                 # Verify that the given event_source exists
-                self._get_event_source(
+                event_source = self._get_event_source(
                     event_source_id=trigger.event_source_id, session=session
                 )
 
-            # Verify that the action exists
-            self._get_action(action_id=trigger.action_id, session=session)
-
             # Verify that the trigger name is unique
             self._fail_if_trigger_with_name_exists(
                 trigger_name=trigger.name,
@@ -8697,6 +8695,11 @@ class SqlZenStore(BaseZenStore):
             )
 
             new_trigger = TriggerSchema.from_request(trigger)
+            if event_source:
+                # Denormalized so that converting the trigger to a response
+                # body doesn't need to load the event source row.
+                new_trigger.event_source_flavor = event_source.flavor
+                new_trigger.event_source_subtype = event_source.plugin_subtype
             session.add(new_trigger)
             session.commit()
             session.refresh(new_trigger)
@@ -8749,12 +8752,51 @@ class SqlZenStore(BaseZenStore):
             A list of all triggers matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(TriggerSchema)
+            # Batch-fetch the relationships that `to_model` dereferences for
+            # every row instead of lazy-loading them per trigger. The
+            # wildcard `raiseload` turns any relationship access that is not
+            # covered by the eager loads below into an error, so accidental
+            # per-row lazy loads added to `to_model` later are caught instead
+            # of silently multiplying the query count.
+            query = select(TriggerSchema).options(
+                selectinload(TriggerSchema.user),  # type: ignore[arg-type]
+                selectinload(
+                    TriggerSchema.action  # type: ignore[arg-type]
+                ).selectinload(ActionSchema.user),
+                selectinload(
+                    TriggerSchema.event_source  # type: ignore[arg-type]
+                ).selectinload(EventSourceSchema.user),
+                selectinload(TriggerSchema.executions),  # type: ignore[arg-type]
+                raiseload("*"),
+            )
+            if hydrate:
+                query = query.options(
+                    selectinload(TriggerSchema.workspace)  # type: ignore[arg-type]
+                )
+            else:
+                # The blob columns are only read for the metadata block, so
+                # don't even transfer them from the database when the page is
+                # not hydrated.
+                query = query.options(
+                    defer(TriggerSchema.event_filter),  # type: ignore[arg-type]
+                    defer(TriggerSchema.schedule),  # type: ignore[arg-type]
+                )
+            # Share one conversion cache across the page so response models
+            # of users, workspaces, actions and event sources backing several
+            # triggers are built only once.
+            conversion_cache: Dict[Tuple[str, UUID], Any] = {}
             return self.filter_and_paginate(
                 session=session,
                 query=query,
                 table=TriggerSchema,
                 filter_model=trigger_filter_model,
+                custom_schema_to_model_conversion=lambda schema: (
+                    schema.to_model(
+                        include_metadata=hydrate,
+                        include_resources=True,
+                        conversion_cache=conversion_cache,
+                    )
+                ),
                 hydrate=hydrate,
             )
 
@@ -8951,12 +8993,49 @@ class SqlZenStore(BaseZenStore):
             A list of all trigger executions matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(TriggerExecutionSchema)
+            # Batch-fetch the trigger (and the relationships its `to_model`
+            # body needs) and guard against accidental lazy loads, mirroring
+            # the trigger listing above.
+            query = select(TriggerExecutionSchema).options(
+                selectinload(
+                    TriggerExecutionSchema.trigger  # type: ignore[arg-type]
+                ).selectinload(TriggerSchema.user),
+                selectinload(
+                    TriggerExecutionSchema.trigger  # type: ignore[arg-type]
+                )
+                .selectinload(TriggerSchema.action)
+                .selectinload(ActionSchema.user),
+                selectinload(
+                    TriggerExecutionSchema.trigger  # type: ignore[arg-type]
+                )
+                .selectinload(TriggerSchema.event_source)
+                .selectinload(EventSourceSchema.user),
+                raiseload("*"),
+            )
+            if not hydrate:
+                # The potentially large event payload is only read for the
+                # metadata block, so don't transfer it when the page is not
+                # hydrated.
+                query = query.options(
+                    defer(  # type: ignore[arg-type]
+                        TriggerExecutionSchema.event_metadata
+                    )
+                )
+            # Share one conversion cache across the page so the trigger
+            # response model backing several executions is built only once.
+            conversion_cache: Dict[Tuple[str, UUID], Any] = {}
             return self.filter_and_paginate(
                 session=session,
                 query=query,
                 table=TriggerExecutionSchema,
                 filter_model=trigger_execution_filter_model,
+                custom_schema_to_model_conversion=lambda schema: (
+                    schema.to_model(
+                        include_metadata=hydrate,
+                        include_resources=True,
+                        conversion_cache=conversion_cache,
+                    )
+                ),
                 hydrate=hydrate,
             )
 
@@ -9602,6 +9681,17 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
             query = select(WorkspaceSchema)
+            if workspace_filter_model.after_id is not None:
+                # Keyset pagination: seek past the cursor instead of relying
+                # solely on the offset-based pagination, which has to scan and
+                # discard all preceding rows.
+                query = query.where(
+                    WorkspaceSchema.id > workspace_filter_model.after_id
+                )
+                # The cursor only yields a stable, gap-free iteration if the
+                # rows are ordered by the cursor column itself; the default
+                # creation-time order is uncorrelated with the random IDs.
+                workspace_filter_model.sort_by = "id"
             return self.filter_and_paginate(
                 session=session,
                 query=query,
@@ -9680,6 +9770,50 @@ class SqlZenStore(BaseZenStore):
             session.delete(workspace)
             session.commit()
 
+    def count_workspace_statistics(
+        self,
+        stack_filter: StackFilter,
+        component_filter: ComponentFilter,
+        pipeline_filter: PipelineFilter,
+        run_filter: PipelineRunFilter,
+    ) -> Dict[str, int]:
+        """Count the stacks, components, pipelines and runs of a workspace.
+
+        The counts are fetched as scalar subqueries of a single query, so
+        only one database round-trip is needed instead of one per entity.
+
+        Args:
+            stack_filter: The filter model to use for counting stacks.
+            component_filter: The filter model to use for counting components.
+            pipeline_filter: The filter model to use for counting pipelines.
+            run_filter: The filter model to use for counting runs.
+
+        Returns:
+            A dictionary mapping the statistic names to their counts.
+        """
+        count_queries: List[Tuple[str, Type[BaseSchema], BaseFilter]] = [
+            ("stacks", StackSchema, stack_filter),
+            ("components", StackComponentSchema, component_filter),
+            ("pipelines", PipelineSchema, pipeline_filter),
+            ("runs", PipelineRunSchema, run_filter),
+        ]
+
+        columns = []
+        for label, schema, filter_model in count_queries:
+            count_query = filter_model.apply_filter(
+                query=select(func.count(schema.id)),  # type: ignore[arg-type]
+                table=schema,
+            )
+            columns.append(count_query.scalar_subquery().label(label))
+
+        with Session(self.engine) as session:
+            row = session.execute(select(*columns)).one()
+
+        return {
+            label: int(count) if count else 0
+            for (label, _, _), count in zip(count_queries, row)
+        }
+
     def _get_or_create_default_workspace(self) -> WorkspaceResponse:
         """Get or create the default workspace if it doesn't exist.
 
@@ -42,6 +42,7 @@ from tests.integration.functional.zen_stores.utils import (
     ServiceConnectorTypeContext,
     StackContext,
     UserContext,
+    WorkspaceContext,
     list_of_entities,
 )
 from tests.unit.pipelines.test_build_utils import (
@@ -101,6 +102,7 @@ from zenml.models import (
     ModelVersionPipelineRunRequest,
     ModelVersionRequest,
     ModelVersionUpdate,
+    PipelineFilter,
     PipelineRequest,
     PipelineRunFilter,
     PipelineRunResponse,
@@ -385,6 +387,71 @@ def test_deleting_default_workspace_fails():
         client.zen_store.delete_workspace(DEFAULT_NAME)
 
 
+def test_listing_workspaces_with_after_id_cursor():
+    """Tests keyset pagination of workspaces with the `after_id` cursor."""
+    store = Client().zen_store
+
+    with WorkspaceContext() as workspace_1, WorkspaceContext() as workspace_2:
+        first_id, second_id = sorted([workspace_1.id, workspace_2.id])
+
+        page = store.list_workspaces(WorkspaceFilter(after_id=first_id))
+        listed_ids = {workspace.id for workspace in page.items}
+
+        assert first_id not in listed_ids
+        assert second_id in listed_ids
+        assert all(listed_id > first_id for listed_id in listed_ids)
+
+        # Iterating page by page with the cursor set to the last seen ID
+        # must visit every workspace exactly once, in ascending ID order.
+        all_ids = {
+            workspace.id
+            for workspace in store.list_workspaces(
+                WorkspaceFilter(size=1000)
+            ).items
+        }
+        collected = []
+        cursor = uuid.UUID(int=0)
+        while True:
+            page = store.list_workspaces(
+                WorkspaceFilter(size=1, after_id=cursor)
+            )
+            if not page.items:
+                break
+            collected.extend(workspace.id for workspace in page.items)
+            cursor = collected[-1]
+
+        assert collected == sorted(collected)
+        assert len(collected) == len(set(collected))
+        assert set(collected) == all_ids
+
+
+def test_workspace_statistics_match_individual_counts():
+    """Tests that the batched statistics query matches individual counts."""
+    client = Client()
+    store = client.zen_store
+    if not isinstance(store, SqlZenStore):
+        pytest.skip("Workspace statistics counting requires a SQL zen store.")
+
+    workspace_id = client.active_workspace.id
+    statistics = store.count_workspace_statistics(
+        stack_filter=StackFilter(workspace_id=workspace_id),
+        component_filter=ComponentFilter(workspace_id=workspace_id),
+        pipeline_filter=PipelineFilter(workspace_id=workspace_id),
+        run_filter=PipelineRunFilter(workspace_id=workspace_id),
+    )
+
+    assert statistics == {
+        "stacks": store.count_stacks(StackFilter(workspace_id=workspace_id)),
+        "components": store.count_stack_components(
+            ComponentFilter(workspace_id=workspace_id)
+        ),
+        "pipelines": store.count_pipelines(
+            PipelineFilter(workspace_id=workspace_id)
+        ),
+        "runs": store.count_runs(PipelineRunFilter(workspace_id=workspace_id)),
+    }
+
+
 #  .------.
 # | USERS |
 # '-------'
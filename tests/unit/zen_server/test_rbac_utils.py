@@ -0,0 +1,81 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import uuid
+from time import sleep
+
+import pytest
+
+from zenml.zen_server.rbac import utils as rbac_utils
+from zenml.zen_server.rbac.models import ResourceType
+
+
+@pytest.fixture
+def mocked_rbac_backend(mocker):
+    """Mock the RBAC machinery that backs allowed resource ID lookups."""
+    mocker.patch.object(
+        rbac_utils,
+        "server_config",
+        return_value=mocker.MagicMock(rbac_enabled=True),
+    )
+    auth_context = mocker.MagicMock()
+    auth_context.user.id = uuid.uuid4()
+    mocker.patch.object(
+        rbac_utils, "get_auth_context", return_value=auth_context
+    )
+    rbac_backend = mocker.MagicMock()
+    rbac_backend.list_allowed_resource_ids.return_value = (
+        False,
+        [str(uuid.uuid4())],
+    )
+    mocker.patch.object(rbac_utils, "rbac", return_value=rbac_backend)
+
+    rbac_utils._invalidate_allowed_resource_ids_cache()
+    yield rbac_backend
+    rbac_utils._invalidate_allowed_resource_ids_cache()
+
+
+def test_allowed_resource_ids_are_cached(mocked_rbac_backend):
+    """Test that repeated lookups within the TTL hit the cache."""
+    first = rbac_utils.get_allowed_resource_ids(
+        resource_type=ResourceType.STACK
+    )
+    second = rbac_utils.get_allowed_resource_ids(
+        resource_type=ResourceType.STACK
+    )
+
+    assert first == second
+    assert mocked_rbac_backend.list_allowed_resource_ids.call_count == 1
+
+    # A different resource type is a different cache entry.
+    rbac_utils.get_allowed_resource_ids(resource_type=ResourceType.PIPELINE)
+    assert mocked_rbac_backend.list_allowed_resource_ids.call_count == 2
+
+
+def test_allowed_resource_ids_cache_expires(mocked_rbac_backend):
+    """Test that cache entries are refreshed once the TTL elapsed."""
+    rbac_utils.get_allowed_resource_ids(resource_type=ResourceType.STACK)
+    sleep(rbac_utils._ALLOWED_IDS_CACHE_TTL * 2)
+    rbac_utils.get_allowed_resource_ids(resource_type=ResourceType.STACK)
+
+    assert mocked_rbac_backend.list_allowed_resource_ids.call_count == 2
+
+
+def test_allowed_resource_ids_cache_invalidation(mocked_rbac_backend):
+    """Test that invalidation drops cached entries before their TTL."""
+    rbac_utils.get_allowed_resource_ids(resource_type=ResourceType.STACK)
+    rbac_utils._invalidate_allowed_resource_ids_cache()
+    rbac_utils.get_allowed_resource_ids(resource_type=ResourceType.STACK)
+
+    assert mocked_rbac_backend.list_allowed_resource_ids.call_count == 2
@@ -0,0 +1,66 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import base64
+
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+from zenml.zen_stores.migrations.versions.a7e4bf5d2c19_store_raw_json_in_trigger_blob_columns import (
+    _transcode_column,
+)
+
+
+def test_transcode_column_roundtrip(tmp_path):
+    """Test the base64 transcoding data migration of binary columns.
+
+    The upgrade unwraps the base64 layer of all values in place, skips
+    NULLs and the downgrade restores the original representation.
+    """
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'migration.db'}")
+    meta = sa.MetaData()
+    table = sa.Table(
+        "trigger",
+        meta,
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("event_filter", sa.LargeBinary()),
+    )
+    meta.create_all(engine)
+
+    raw = b'{"event_type":"push"}'
+    with engine.begin() as conn:
+        conn.execute(
+            sa.insert(table),
+            [
+                {"id": "1", "event_filter": base64.b64encode(raw)},
+                {"id": "2", "event_filter": None},
+            ],
+        )
+
+        with Operations.context(MigrationContext.configure(conn)):
+            _transcode_column("trigger", "event_filter", encode=False)
+            decoded = {
+                row.id: row.event_filter
+                for row in conn.execute(sa.select(table))
+            }
+
+            _transcode_column("trigger", "event_filter", encode=True)
+            encoded = {
+                row.id: row.event_filter
+                for row in conn.execute(sa.select(table))
+            }
+
+    assert decoded == {"1": raw, "2": None}
+    assert encoded == {"1": base64.b64encode(raw), "2": None}
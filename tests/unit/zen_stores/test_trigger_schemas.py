@@ -0,0 +1,159 @@
+#  Copyright (c) ZenML GmbH 2025. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import base64
+import json
+
+from sqlalchemy.orm import raiseload, selectinload
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from zenml.zen_stores.schemas import (
+    ActionSchema,
+    EventSourceSchema,
+    TriggerSchema,
+    UserSchema,
+    WorkspaceSchema,
+)
+from zenml.zen_stores.schemas.trigger_schemas import (
+    _COMPRESSED_TAG,
+    _COMPRESSION_THRESHOLD,
+    _decode_blob,
+    _decompress_blob,
+    _encode_blob,
+)
+
+
+def test_small_blobs_are_stored_as_plain_json():
+    """Test that payloads below the threshold are stored uncompressed."""
+    value = {"event_type": "push", "branch": "main"}
+
+    data = _encode_blob(value)
+
+    assert len(data) < _COMPRESSION_THRESHOLD
+    assert not data.startswith(_COMPRESSED_TAG)
+    # The stored bytes are plain JSON, readable without the codec.
+    assert json.loads(data) == value
+    assert _decode_blob(data) == value
+
+
+def test_large_blobs_are_compressed_and_tagged():
+    """Test that payloads at or above the threshold are compressed."""
+    value = {"event_types": ["push"] * _COMPRESSION_THRESHOLD}
+    raw_size = len(json.dumps(value))
+    assert raw_size >= _COMPRESSION_THRESHOLD
+
+    data = _encode_blob(value)
+
+    assert data.startswith(_COMPRESSED_TAG)
+    assert len(data) < raw_size
+    assert _decode_blob(data) == value
+
+
+def test_decoding_untagged_legacy_blobs():
+    """Test that rows written before compression existed still decode."""
+    legacy = json.dumps({"event_type": "push"}).encode("utf-8")
+
+    assert _decompress_blob(legacy) == legacy
+    assert _decode_blob(legacy) == {"event_type": "push"}
+
+
+def test_detached_trigger_row_converts_without_lazy_loading(tmp_path):
+    """Test that a listed trigger row converts to a model when detached.
+
+    The trigger listing query eager-loads every relationship that
+    `to_model` dereferences; converting a row after its session was closed
+    proves that no attribute access falls back to a lazy load.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'triggers.db'}")
+    SQLModel.metadata.create_all(engine)
+
+    user = UserSchema(name="aria", full_name="", active=True)
+    service_account = UserSchema(
+        name="aria_sa", full_name="", active=True, is_service_account=True
+    )
+    workspace = WorkspaceSchema(name="default", description="")
+    action = ActionSchema(
+        name="action",
+        workspace_id=workspace.id,
+        user_id=user.id,
+        service_account_id=service_account.id,
+        auth_window=60,
+        flavor="builtin",
+        plugin_subtype="pipeline_run",
+        configuration=base64.b64encode(b"{}"),
+    )
+    event_source = EventSourceSchema(
+        name="event_source",
+        workspace_id=workspace.id,
+        user_id=user.id,
+        flavor="github",
+        plugin_subtype="webhook",
+        description="",
+        configuration=base64.b64encode(b"{}"),
+        is_active=True,
+    )
+    trigger = TriggerSchema(
+        name="trigger",
+        workspace_id=workspace.id,
+        user_id=user.id,
+        action_id=action.id,
+        event_source_id=event_source.id,
+        event_source_flavor=event_source.flavor,
+        event_source_subtype=event_source.plugin_subtype,
+        event_filter=_encode_blob({"event_type": "push"}),
+        description="",
+        is_active=True,
+    )
+    trigger_id = trigger.id
+    action_id = action.id
+    event_source_id = event_source.id
+
+    with Session(engine) as session:
+        session.add_all(
+            [user, service_account, workspace, action, event_source, trigger]
+        )
+        session.commit()
+
+    # Mirror the loader options of `SqlZenStore.list_triggers` for a
+    # hydrated page: everything `to_model` touches is eager-loaded and any
+    # other relationship access raises instead of lazy-loading.
+    with Session(engine) as session:
+        row = session.exec(
+            select(TriggerSchema).options(
+                selectinload(TriggerSchema.user),
+                selectinload(TriggerSchema.action).selectinload(
+                    ActionSchema.user
+                ),
+                selectinload(TriggerSchema.event_source).selectinload(
+                    EventSourceSchema.user
+                ),
+                selectinload(TriggerSchema.executions),
+                selectinload(TriggerSchema.workspace),
+                raiseload("*"),
+            )
+        ).one()
+
+    # The session is closed: any lazy load would raise a
+    # `DetachedInstanceError` instead of silently issuing a query.
+    response = row.to_model(include_metadata=True, include_resources=True)
+
+    assert response.id == trigger_id
+    assert response.body.action_flavor == "builtin"
+    assert response.body.event_source_flavor == "github"
+    assert response.body.user.name == "aria"
+    assert response.metadata.workspace.name == "default"
+    assert response.metadata.event_filter == {"event_type": "push"}
+    assert response.resources.action.id == action_id
+    assert response.resources.event_source.id == event_source_id
+    assert response.resources.executions.items == []